@@ -1,9 +1,27 @@
 import sys
 import json
 import argparse
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 
-from .analyzer import analyze_text, CheckerOptions
+from .analyzer import analyze_text, expand_columns, CheckerOptions, READABILITY_BASIC, READABILITY_FULL
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
+
+def dumps_json(result: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
+def non_negative_int(value: str) -> int:
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+    return n
 
 
 def read_input_text(file_path: Optional[str]) -> str:
@@ -16,13 +34,13 @@ def read_input_text(file_path: Optional[str]) -> str:
     return sys.stdin.read()
 
 
-def format_human(result: dict) -> str:
-    lines = []
+def iter_human_lines(result: dict) -> Iterator[str]:
+    result = expand_columns(result)
     s = result["summary"]
-    lines.append(f"Summary: {s['words']} words, {s['sentences']} sentences, {s['characters']} chars")
+    yield f"Summary: {s['words']} words, {s['sentences']} sentences, {s['characters']} chars"
 
     r = result["readability"]
-    lines.append("Readability:")
+    yield "Readability:"
     for k in [
         "flesch_reading_ease",
         "flesch_kincaid_grade",
@@ -32,40 +50,47 @@ def format_human(result: dict) -> str:
     ]:
         v = r.get(k)
         if v is not None:
-            lines.append(f"  - {k.replace('_',' ').title()}: {v:.2f}")
+            yield f"  - {k.replace('_',' ').title()}: {v:.2f}"
 
     sp = result["spelling"]
-    lines.append(f"Spelling: {sp['total_unknown']} potential issue(s)")
+    yield f"Spelling: {sp['total_unknown']} potential issue(s)"
     for issue in sp["issues"][:20]:
-        lines.append(f"  - '{issue['word']}' -> suggestion: {issue['suggestion']}")
+        yield f"  - '{issue['word']}' -> suggestion: {issue['suggestion']}"
     if sp["total_unknown"] > 20:
-        lines.append(f"  ... and {sp['total_unknown'] - 20} more")
+        yield f"  ... and {sp['total_unknown'] - 20} more"
 
     st = result["style"]
     if st["long_sentences"]:
-        lines.append("Style: Long sentences")
+        yield "Style: Long sentences"
         for item in st["long_sentences"][:10]:
-            lines.append(f"  - #{item['index']} ({item['word_count']} words): {item['text']}")
+            yield f"  - #{item['index']} ({item['word_count']} words): {item['text']}"
     if st["passive_voice"]:
-        lines.append("Style: Possible passive voice")
+        yield "Style: Possible passive voice"
         for item in st["passive_voice"][:10]:
-            lines.append(f"  - #{item['index']}: {item['match']}")
+            yield f"  - #{item['index']}: {item['match']}"
     if st["adverbs"]:
-        lines.append("Style: Adverbs (-ly)")
+        yield "Style: Adverbs (-ly)"
         for item in st["adverbs"][:10]:
-            lines.append(f"  - {item['word']} x{item['count']}")
+            yield f"  - {item['word']} x{item['count']}"
 
     rep = result["repetition"]
     if rep["duplicate_words"]:
-        lines.append("Repetition: Immediate duplicate words")
+        yield "Repetition: Immediate duplicate words"
         for item in rep["duplicate_words"][:10]:
-            lines.append(f"  - '{item['word']}' at positions {item['occurrences'][:5]}")
+            yield f"  - '{item['word']}' at positions {item['occurrences'][:5]}"
     if rep["duplicate_sentences"]:
-        lines.append("Repetition: Duplicate sentences")
+        yield "Repetition: Duplicate sentences"
         for item in rep["duplicate_sentences"][:5]:
-            lines.append(f"  - x{item['count']}: {item['sentence']}")
+            yield f"  - x{item['count']}: {item['sentence']}"
 
-    return "\n".join(lines)
+
+def format_human(result: dict) -> str:
+    return "\n".join(iter_human_lines(result))
+
+
+def format_human_stream(result: dict, out: TextIO) -> None:
+    # Write as lines are produced instead of joining one large string first
+    out.writelines(f"{line}\n" for line in iter_human_lines(result))
 
 
 def main(argv=None) -> int:
@@ -75,9 +100,22 @@ def main(argv=None) -> int:
     p_check = sub.add_parser("check", help="Analyze text from a file or stdin")
     p_check.add_argument("--file", "-f", help="Path to input text file")
     p_check.add_argument("--json", action="store_true", help="Output JSON")
+    p_check.add_argument("--soa", action="store_true", help="With --json, emit style/repetition lists as parallel arrays")
     p_check.add_argument("--lang", default="en", help="Spellcheck language (default: en)")
     p_check.add_argument("--long-sentence-threshold", type=int, default=30, help="Words per sentence threshold")
     p_check.add_argument("--max-duplicates", type=int, default=1, help="Max allowed exact duplicate sentences")
+    p_check.add_argument("--max-suggestions", type=non_negative_int, default=20, help="Max misspellings to suggest corrections for")
+    p_check.add_argument(
+        "--parallel-suggestions",
+        action="store_true",
+        help="Compute large batches of suggestions in a process pool",
+    )
+    p_check.add_argument(
+        "--readability",
+        choices=["basic", "full"],
+        default="basic",
+        help="Readability metrics: basic (Flesch, FK grade, ARI) or full (adds Fog, SMOG, Dale-Chall, counts)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -94,13 +132,18 @@ def main(argv=None) -> int:
         lang=args.lang,
         long_sentence_threshold=args.long_sentence_threshold,
         max_duplicate_sentences=args.max_duplicates,
+        max_suggestions=args.max_suggestions,
+        parallel_suggestions=args.parallel_suggestions,
+        readability_metrics=READABILITY_FULL if args.readability == "full" else READABILITY_BASIC,
+        soa=args.soa,
     )
     result = analyze_text(text, options)
 
     if args.json:
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        sys.stdout.write(dumps_json(result))
+        sys.stdout.write("\n")
     else:
-        print(format_human(result))
+        format_human_stream(result, sys.stdout)
 
     return 0
 
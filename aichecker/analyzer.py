@@ -1,122 +1,258 @@
+import copy
+import os
 import re
-from collections import Counter, defaultdict
+import multiprocessing
+import threading
+from collections import Counter, OrderedDict, defaultdict
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Callable, Optional, Tuple
 
 from spellchecker import SpellChecker
-import textstat
 
 
-@dataclass
+# Patterns are compiled once at import time and shared by all analyzers
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[A-Za-z]+(?:[-'][A-Za-z]+)*")
+_WB_RE = re.compile(r"\b\w+\b")
+_NORM_PUNCT = re.compile(r"[\s\W_]+")
+_NORM_WS = re.compile(r"\s+")
+# Passive voice (heuristic): be-verb + past participle (-ed word)
+# be/been/being share one branch, and the \b assertions around \s+ are implied
+_PASSIVE_RE = re.compile(r"\b(?:am|is|are|was|were|be(?:en|ing)?)\s+(\w+ed)\b", re.IGNORECASE)
+# Common -ly words that are not adverbs
+_SKIP_LY = frozenset({"family", "only", "supply", "reply", "apply", "imply", "early", "italy", "july"})
+
+# Readability tiers; the full set adds the slower indices and word-list based counts
+READABILITY_BASIC = ("flesch_reading_ease", "flesch_kincaid_grade", "automated_readability_index")
+READABILITY_FULL = (
+    "flesch_reading_ease",
+    "flesch_kincaid_grade",
+    "gunning_fog",
+    "smog_index",
+    "automated_readability_index",
+    "coleman_liau_index",
+    "dale_chall",
+    "difficult_words",
+    "polysyllables",
+    "lexicon_count",
+    "sentence_count",
+)
+_READABILITY_COUNTS = frozenset({"difficult_words", "polysyllables", "lexicon_count", "sentence_count"})
+
+# Result lists that can be emitted column-oriented, with their fields
+_COLUMN_SECTIONS = {
+    ("style", "long_sentences"): ("index", "word_count", "text"),
+    ("style", "passive_voice"): ("index", "match", "sentence"),
+    ("style", "adverbs"): ("word", "count"),
+    ("repetition", "duplicate_words"): ("word", "occurrences"),
+}
+
+
+@dataclass(frozen=True)
 class CheckerOptions:
     lang: str = "en"
     long_sentence_threshold: int = 30
     max_duplicate_sentences: int = 1
+    max_suggestions: int = 20
+    # Compute large batches of suggestions in a process pool (see analyze_spelling)
+    parallel_suggestions: bool = False
+    readability_metrics: Tuple[str, ...] = READABILITY_BASIC
+    # Emit the larger result lists as parallel arrays instead of lists of dicts
+    soa: bool = False
+
+    def __post_init__(self) -> None:
+        # Options are a cache key, so accept any iterable of metric names but
+        # store a (hashable) tuple
+        object.__setattr__(self, "readability_metrics", tuple(self.readability_metrics))
 
 
 def split_sentences(text: str) -> List[str]:
     # Naive sentence splitter; keeps punctuation with sentence
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip()) if text.strip() else []
+    sentences = _SENT_SPLIT.split(text.strip()) if text.strip() else []
     # Remove empty trailing segments
     return [s for s in sentences if s]
 
 
 def tokenize(text: str) -> List[str]:
     # Keep words with apostrophes/hyphens as single tokens
-    return re.findall(r"[A-Za-z]+(?:[-'][A-Za-z]+)*", text)
+    return _WORD_RE.findall(text)
+
+
+def tokenize_lower(text: str) -> List[str]:
+    # Same as tokenize, but lowercases the text once instead of every token.
+    # Only safe for ASCII: some characters lower to ASCII letters (e.g. the
+    # Kelvin sign becomes "k"), which would change where words split.
+    if text.isascii():
+        return _WORD_RE.findall(text.lower())
+    return [t.lower() for t in _WORD_RE.findall(text)]
 
 
 def normalize_sentence(s: str) -> str:
     # Lowercase, remove extra spaces and terminal punctuation
-    return re.sub(r"\s+", " ", re.sub(r"[\s\W_]+", " ", s.lower())).strip()
+    return _NORM_WS.sub(" ", _NORM_PUNCT.sub(" ", s.lower())).strip()
+
 
+def _readability_functions() -> Dict[str, Callable[[str], Any]]:
+    # textstat is slow to import, so load it only once readability is requested
+    import textstat
 
-def analyze_readability(text: str) -> Dict[str, Any]:
+    return {
+        "flesch_reading_ease": textstat.flesch_reading_ease,
+        "flesch_kincaid_grade": textstat.flesch_kincaid_grade,
+        "gunning_fog": textstat.gunning_fog,
+        "smog_index": textstat.smog_index,
+        "automated_readability_index": textstat.automated_readability_index,
+        "coleman_liau_index": textstat.coleman_liau_index,
+        "dale_chall": textstat.dale_chall_readability_score,
+        "difficult_words": textstat.difficult_words,
+        "polysyllables": textstat.polysyllabcount,
+        "lexicon_count": lambda t: textstat.lexicon_count(t, removepunct=True),
+        "sentence_count": textstat.sentence_count,
+    }
+
+
+def analyze_readability(text: str, metrics: Tuple[str, ...] = READABILITY_FULL) -> Dict[str, Any]:
+    unknown = [m for m in metrics if m not in READABILITY_FULL]
+    if unknown:
+        raise ValueError(f"Unknown readability metric(s): {', '.join(unknown)}")
     if not text.strip():
-        return {
-            "flesch_reading_ease": None,
-            "flesch_kincaid_grade": None,
-            "gunning_fog": None,
-            "smog_index": None,
-            "automated_readability_index": None,
-            "coleman_liau_index": None,
-            "dale_chall": None,
-            "difficult_words": 0,
-            "polysyllables": 0,
-            "lexicon_count": 0,
-            "sentence_count": 0,
-        }
+        # Scores are undefined for empty text; counts are zero
+        return {m: 0 if m in _READABILITY_COUNTS else None for m in metrics}
+    if not metrics:
+        return {}
+    functions = _readability_functions()
     try:
-        return {
-            "flesch_reading_ease": textstat.flesch_reading_ease(text),
-            "flesch_kincaid_grade": textstat.flesch_kincaid_grade(text),
-            "gunning_fog": textstat.gunning_fog(text),
-            "smog_index": textstat.smog_index(text),
-            "automated_readability_index": textstat.automated_readability_index(text),
-            "coleman_liau_index": textstat.coleman_liau_index(text),
-            "dale_chall": textstat.dale_chall_readability_score(text),
-            "difficult_words": textstat.difficult_words(text),
-            "polysyllables": textstat.polysyllabcount(text),
-            "lexicon_count": textstat.lexicon_count(text, removepunct=True),
-            "sentence_count": textstat.sentence_count(text),
-        }
+        return {m: functions[m](text) for m in metrics}
     except Exception:
         # In case textstat errors on certain inputs
-        return {
-            "flesch_reading_ease": None,
-            "flesch_kincaid_grade": None,
-            "gunning_fog": None,
-            "smog_index": None,
-            "automated_readability_index": None,
-            "coleman_liau_index": None,
-            "dale_chall": None,
-            "difficult_words": None,
-            "polysyllables": None,
-            "lexicon_count": len(tokenize(text)),
-            "sentence_count": len(split_sentences(text)),
+        fallback = {
+            "lexicon_count": lambda: len(tokenize(text)),
+            "sentence_count": lambda: len(split_sentences(text)),
         }
+        return {m: fallback[m]() if m in fallback else None for m in metrics}
+
+
+@lru_cache(maxsize=8)
+def _get_spell(lang: str) -> SpellChecker:
+    # Loading a dictionary is expensive; reuse one checker per language
+    return SpellChecker(language=lang)
+
+
+def _correct(lang: str, word: str) -> Optional[str]:
+    # Uncached edit-distance search; also the process pool's worker function
+    return _get_spell(lang).correction(word)
+
 
+# LRU cache of corrections keyed by (lang, word). A plain dict rather than
+# lru_cache so results computed in pool workers can be stored here too.
+# The cache is shared by every thread calling analyze_text, so all reads and
+# writes go through _corrections_lock.
+_CORRECTIONS_MAX = 4096
+_corrections: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+_corrections_lock = threading.Lock()
 
-def analyze_spelling(text: str, lang: str) -> Dict[str, Any]:
-    tokens = re.findall(r"\b\w+\b", text)
-    # Exclude tokens containing uppercase letters (likely proper nouns/acronyms)
-    lower_tokens = [t.lower() for t in tokens if t.isalpha() and not any(c.isupper() for c in t)]
-    spell = SpellChecker(language=lang)
-    unknown = spell.unknown(lower_tokens)
-    issues = []
-    for w in sorted(unknown):
-        suggestion = spell.correction(w)
-        issues.append({"word": w, "suggestion": suggestion})
+
+# Below this many uncached words a process pool costs more to start than it saves
+_PARALLEL_SUGGESTIONS_MIN = 50
+
+
+def _suggest(lang: str, words: List[str], parallel: bool = False) -> List[Optional[str]]:
+    found: Dict[str, Optional[str]] = {}
+    misses = []
+    with _corrections_lock:
+        for w in words:
+            key = (lang, w)
+            if key in _corrections:
+                _corrections.move_to_end(key)
+                found[w] = _corrections[key]
+            else:
+                misses.append(w)
+
+    workers = os.cpu_count() or 1
+    use_pool = (
+        parallel
+        and len(misses) > _PARALLEL_SUGGESTIONS_MIN
+        and workers > 1
+        # Daemonic processes are not allowed to have children
+        and not multiprocessing.current_process().daemon
+    )
+    if use_pool:
+        # Each worker lazily builds (or inherits) its own cached checker
+        with multiprocessing.Pool(workers) as pool:
+            suggestions = pool.starmap(_correct, [(lang, w) for w in misses])
+    else:
+        suggestions = [_correct(lang, w) for w in misses]
+    # The search itself runs unlocked; only the cache update is serialized
+    with _corrections_lock:
+        for w, suggestion in zip(misses, suggestions):
+            _corrections[(lang, w)] = suggestion
+            if len(_corrections) > _CORRECTIONS_MAX:
+                _corrections.popitem(last=False)
+            found[w] = suggestion
+
+    return [found[w] for w in words]
+
+
+def analyze_spelling(
+    text: str,
+    lang: str,
+    max_suggestions: int = 20,
+    parallel_suggestions: bool = False,
+) -> Dict[str, Any]:
+    tokens = _WB_RE.findall(text)
+    # Exclude tokens containing uppercase letters (likely proper nouns/acronyms).
+    # For ASCII words islower() is exactly that check and runs in C; other words
+    # keep the per-character test so titlecase letters (e.g. U+01C5) and uncased
+    # scripts such as Arabic are handled as before.
+    lower_tokens = [
+        t if t.isascii() else t.lower()
+        for t in tokens
+        if t.isalpha() and (t.islower() if t.isascii() else not any(map(str.isupper, t)))
+    ]
+    spell = _get_spell(lang)
+    # Set difference against the dictionary keys drops known words in one pass;
+    # unknown() then only applies its own filters to the short remainder
+    unknown = spell.unknown(set(lower_tokens).difference(spell.word_frequency.dictionary))
+    issues = [{"word": w, "suggestion": None} for w in sorted(unknown)]
+    # Corrections are the costly part; only compute them for the first few issues
+    # Clamp so a negative limit means "none" rather than slicing from the end
+    head = issues[:max(0, max_suggestions)]
+    # A process pool is only used when the caller opts in: under the spawn start
+    # method it needs an `if __name__ == "__main__":` guard in the calling script
+    suggestions = _suggest(lang, [i["word"] for i in head], parallel_suggestions)
+    for issue, suggestion in zip(head, suggestions):
+        issue["suggestion"] = suggestion
     return {"total_unknown": len(issues), "issues": issues}
 
 
-def analyze_style(text: str, long_sentence_threshold: int) -> Dict[str, Any]:
-    sentences = split_sentences(text)
+def analyze_style(
+    sentences: List[str],
+    tokens: List[str],
+    long_sentence_threshold: int,
+    word_counts: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    if word_counts is None:
+        word_counts = [len(tokenize(s)) for s in sentences]
     long_sentences = []
     passive_hits = []
     adverbs = []
 
     # Long sentences
-    for i, s in enumerate(sentences):
-        wc = len(tokenize(s))
+    for i, (s, wc) in enumerate(zip(sentences, word_counts)):
         if wc > long_sentence_threshold:
             long_sentences.append({"index": i, "word_count": wc, "text": s})
 
-    # Passive voice (heuristic): be-verb + past participle (-ed word)
-    be_verbs = r"am|is|are|was|were|be|been|being"
-    passive_re = re.compile(rf"\b(?:{be_verbs})\b\s+\b(\w+ed)\b", re.IGNORECASE)
+    # Passive voice
     for i, s in enumerate(sentences):
-        for m in passive_re.finditer(s):
+        for m in _PASSIVE_RE.finditer(s):
             passive_hits.append({"index": i, "match": m.group(0), "sentence": s})
 
-    # Adverbs ending with -ly (simple heuristic)
-    words = [w.lower() for w in tokenize(text)]
-    adverb_counts = Counter([w for w in words if len(w) > 3 and w.endswith("ly")])
-    # Filter some common false positives
-    skip = {"family", "only", "supply", "reply", "apply", "imply"}
+    # Adverbs ending with -ly (simple heuristic); tokens are already lowercase
+    adverb_counts = Counter(w for w in tokens if len(w) > 3 and w.endswith("ly") and w not in _SKIP_LY)
     for w, c in adverb_counts.items():
-        if w not in skip:
-            adverbs.append({"word": w, "count": c})
+        adverbs.append({"word": w, "count": c})
     adverbs.sort(key=lambda x: (-x["count"], x["word"]))
 
     return {
@@ -126,12 +262,12 @@ def analyze_style(text: str, long_sentence_threshold: int) -> Dict[str, Any]:
     }
 
 
-def analyze_repetition(text: str, max_duplicate_sentences: int) -> Dict[str, Any]:
-    words = [w.lower() for w in tokenize(text)]
+def analyze_repetition(sentences: List[str], tokens: List[str], max_duplicate_sentences: int) -> Dict[str, Any]:
     duplicate_words_positions: Dict[str, List[int]] = defaultdict(list)
 
+    # tokens are already lowercase
     prev = None
-    for i, w in enumerate(words):
+    for i, w in enumerate(tokens):
         if prev == w:
             duplicate_words_positions[w].append(i)
         prev = w
@@ -142,40 +278,46 @@ def analyze_repetition(text: str, max_duplicate_sentences: int) -> Dict[str, Any
         if pos
     ]
 
-    sentences = split_sentences(text)
     normalized = [normalize_sentence(s) for s in sentences]
     counts = Counter([n for n in normalized if n])
-    dup_sentences = [
-        {"sentence": sentences[i], "count": counts[normalized[i]]}
-        for i in range(len(sentences))
-        if normalized[i] and counts[normalized[i]] > max_duplicate_sentences
-    ]
 
-    # Deduplicate entries while keeping original order
-    seen = set()
-    result_sentences = []
-    for item in dup_sentences:
-        key = (normalize_sentence(item["sentence"]))
-        if key not in seen:
-            seen.add(key)
-            result_sentences.append(item)
+    # Report each duplicated sentence once, at its first occurrence
+    dup_sentences: Dict[str, Dict[str, Any]] = {}
+    for s, n in zip(sentences, normalized):
+        if n and n not in dup_sentences and (c := counts[n]) > max_duplicate_sentences:
+            dup_sentences[n] = {"sentence": s, "count": c}
+    result_sentences = list(dup_sentences.values())
 
     return {"duplicate_words": dup_words, "duplicate_sentences": result_sentences}
 
 
 def analyze_text(text: str, options: CheckerOptions) -> Dict[str, Any]:
-    readability = analyze_readability(text)
-    spelling = analyze_spelling(text, options.lang)
-    style = analyze_style(text, options.long_sentence_threshold)
-    repetition = analyze_repetition(text, options.max_duplicate_sentences)
+    # Callers get their own copy so mutating a result can't corrupt the cache
+    return copy.deepcopy(_analyze_cached(text, options))
+
+
+@lru_cache(maxsize=32)
+def _analyze_cached(text: str, options: CheckerOptions) -> Dict[str, Any]:
+    # Split and tokenize once; the analyzers below share the results
+    sentences = split_sentences(text)
+    # Words never span a sentence boundary, so tokenizing each sentence once
+    # gives both the per-sentence word counts and the full token list
+    sentence_tokens = [tokenize_lower(s) for s in sentences]
+    word_counts = [len(t) for t in sentence_tokens]
+    tokens = list(chain.from_iterable(sentence_tokens))
+
+    readability = analyze_readability(text, options.readability_metrics)
+    spelling = analyze_spelling(text, options.lang, options.max_suggestions, options.parallel_suggestions)
+    style = analyze_style(sentences, tokens, options.long_sentence_threshold, word_counts)
+    repetition = analyze_repetition(sentences, tokens, options.max_duplicate_sentences)
 
     summary = {
         "characters": len(text),
-        "words": len(tokenize(text)),
-        "sentences": len(split_sentences(text)),
+        "words": len(tokens),
+        "sentences": len(sentences),
     }
 
-    return {
+    result = {
         "summary": summary,
         "readability": readability,
         "spelling": spelling,
@@ -183,3 +325,20 @@ def analyze_text(text: str, options: CheckerOptions) -> Dict[str, Any]:
         "repetition": repetition,
         "options": asdict(options),
     }
+    if options.soa:
+        for (section, key), fields in _COLUMN_SECTIONS.items():
+            items = result[section][key]
+            result[section][key] = {f: [item[f] for item in items] for f in fields}
+    return result
+
+
+def expand_columns(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Inverse of CheckerOptions.soa: turn parallel arrays back into lists of dicts.
+    # Returns a new result and leaves the input untouched.
+    if not result.get("options", {}).get("soa"):
+        return result
+    expanded = {k: dict(v) if isinstance(v, dict) else v for k, v in result.items()}
+    for (section, key), fields in _COLUMN_SECTIONS.items():
+        columns = expanded[section][key]
+        expanded[section][key] = [dict(zip(fields, row)) for row in zip(*(columns[f] for f in fields))]
+    return expanded
@@ -111,7 +111,7 @@
       if (w.length > 3 && w.endsWith("ly")) acc[w] = (acc[w] || 0) + 1;
       return acc;
     }, {});
-    const skip = new Set(["family", "only", "supply", "reply", "apply", "imply"]);
+    const skip = new Set(["family", "only", "supply", "reply", "apply", "imply", "early", "italy", "july"]);
     const adverbs = Object.entries(adverbCounts)
       .filter(([w]) => !skip.has(w))
       .map(([word, count]) => ({ word, count }))